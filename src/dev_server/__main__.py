@@ -4,6 +4,7 @@ import logging
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    import argparse
     from collections.abc import Callable
 
     from typing_extensions import Protocol
@@ -21,11 +22,73 @@ if TYPE_CHECKING:
         url: str
         output: str
         indent: int | None
+        files: list[str]
+        jobs: int | None
+        chunk_size: int
+        as_json: bool
 
 
 logger = logging.getLogger(__name__)
 
 
+def positive_int(value: str) -> int:
+    import argparse
+
+    ret = int(value)
+    if ret <= 0:
+        msg = f"must be a positive integer: {value!r}"
+        raise argparse.ArgumentTypeError(msg)
+    return ret
+
+
+def _add_analyze_parser(
+    subparsers: argparse._SubParsersAction[argparse.ArgumentParser],
+) -> argparse.ArgumentParser:
+    analyze_parser = subparsers.add_parser(
+        "analyze",
+        help="Summarize recorded proxy traffic per route (counts, error rates, latency)",
+    )
+    analyze_parser.add_argument("files", nargs="+", help="JSONL files written by the proxy")
+    analyze_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=positive_int,
+        default=None,
+        help="Number of worker processes used for parsing (default: CPU count)",
+    )
+    analyze_parser.add_argument(
+        "--chunk-size",
+        type=positive_int,
+        default=32 * 1024 * 1024,
+        help="Bytes of input handed to each worker at a time",
+    )
+    analyze_parser.add_argument(
+        "--json", dest="as_json", action="store_true", help="Print the summary as JSON"
+    )
+    return analyze_parser
+
+
+def _analyze(args: Args, parser: argparse.ArgumentParser) -> int:
+    from dev_server.traffic_analyzer import analyze_files
+    from dev_server.traffic_analyzer import format_report
+
+    try:
+        summary = analyze_files(args.files, jobs=args.jobs, chunk_size=args.chunk_size)
+    except OSError as e:
+        parser.error(f"{e.filename}: {e.strerror}")
+    report = summary.report()
+    if args.as_json:
+        import json
+
+        print(json.dumps({"routes": report, "skipped": summary.skipped}, indent=2))
+    else:
+        print(format_report(report, skipped=summary.skipped))
+    if not report and summary.skipped:
+        logger.error("No records could be parsed from %s", ", ".join(args.files))
+        return 1
+    return 0
+
+
 def main(argv: list[str] | None = None) -> int:
     import argparse
 
@@ -37,6 +100,7 @@ def main(argv: list[str] | None = None) -> int:
             "  %(prog)s mock --responses responses.json\n"
             "  %(prog)s proxy https://example.com -o requests.jsonl\n"
             "  %(prog)s single-request\n"
+            "  %(prog)s analyze requests.jsonl\n"
         ),
     )
     parser.add_argument("-p", "--port", type=int, default=3000, help="Port to run the server on")
@@ -108,6 +172,14 @@ def main(argv: list[str] | None = None) -> int:
     # endregion: Single request parser
     ############################################################################
 
+    ############################################################################
+    # region: Analyze parser
+    ############################################################################
+    analyze_parser = _add_analyze_parser(subparsers)
+    ############################################################################
+    # endregion: Analyze parser
+    ############################################################################
+
     args: Args = parser.parse_args(argv)  # pyright: ignore[reportAssignmentType] # pyrefly: ignore[bad-assignment]
     level = max(logging.ERROR - (args.verbose * 10), logging.DEBUG)
     logging.basicConfig(
@@ -124,14 +196,13 @@ def main(argv: list[str] | None = None) -> int:
 
         from dev_server.serve_single_request import serve_single_request
 
-        url: str = args.url
-        if url is not None:
+        if args.url is not None:
             import sys
             import webbrowser
 
-            logger.info("Opening browser for authentication: %s", url)
-            if not webbrowser.open_new_tab(url):
-                print(f"Please open {url} in your browser", file=sys.stderr)
+            logger.info("Opening browser for authentication: %s", args.url)
+            if not webbrowser.open_new_tab(args.url):
+                print(f"Please open {args.url} in your browser", file=sys.stderr)
         result = serve_single_request(
             handler=lambda x: x, port=args.port, host=args.host, timeout=args.timeout
         )
@@ -141,6 +212,15 @@ def main(argv: list[str] | None = None) -> int:
     # endregion: Single request
     ############################################################################
 
+    ############################################################################
+    # region: Analyze
+    ############################################################################
+    if args.command == "analyze":
+        return _analyze(args, analyze_parser)
+    ############################################################################
+    # endregion: Analyze
+    ############################################################################
+
     ############################################################################
     # region: Mock request
     ############################################################################
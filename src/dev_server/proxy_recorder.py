@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import json
+import time
+import urllib.error
 import urllib.parse
 import urllib.request
 from dataclasses import dataclass
@@ -26,13 +28,16 @@ class ProxyRecorder:
     timeout: float = 10.0
     json_indent: int | None = None
 
-    def record(self, request: RequestRecord, response: ResponseRecord) -> None:
+    def record(
+        self, request: RequestRecord, response: ResponseRecord, elapsed: float | None = None
+    ) -> None:
         with open(self.output, "a", encoding="utf-8") as f:
             json.dump(
                 {
                     "base_url": self.base_url,
                     "request": request,
                     "response": response,
+                    "elapsed": elapsed,
                 },
                 f,
                 ensure_ascii=False,
@@ -67,17 +72,27 @@ class ProxyRecorder:
             headers=request["headers"],
             data=request["content"],
         )
-        response: HTTPResponse = urllib.request.urlopen(  # noqa: S310
-            url=req,
-            timeout=self.timeout,
-            context=self.ssl_context,
-        )
-        response_record: ResponseRecord = {
-            "status_code": response.getcode(),
-            "headers": clean_headers(dict(response.getheaders())),
-            "body": response.read().decode("utf-8", errors="replace"),
-        }
-        self.record(request_record, response_record)
+        start = time.perf_counter()
+        try:
+            response: HTTPResponse = urllib.request.urlopen(  # noqa: S310
+                url=req,
+                timeout=self.timeout,
+                context=self.ssl_context,
+            )
+        except urllib.error.HTTPError as e:
+            # 4xx/5xx responses are still exchanges worth recording and relaying.
+            response_record: ResponseRecord = {
+                "status_code": e.code,
+                "headers": clean_headers(dict(e.headers.items())),
+                "body": e.read().decode("utf-8", errors="replace"),
+            }
+        else:
+            response_record = {
+                "status_code": response.getcode(),
+                "headers": clean_headers(dict(response.getheaders())),
+                "body": response.read().decode("utf-8", errors="replace"),
+            }
+        self.record(request_record, response_record, elapsed=time.perf_counter() - start)
         return {
             "status_code": response_record["status_code"],
             "headers": response_record["headers"],
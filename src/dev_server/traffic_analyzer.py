@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import re
+from collections import Counter
+from dataclasses import dataclass
+from dataclasses import field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from typing_extensions import TypedDict
+
+    class RouteReport(TypedDict):
+        method: str
+        route: str
+        count: int
+        errors: int
+        error_rate: float
+        p50_ms: float | None
+        p90_ms: float | None
+        p99_ms: float | None
+        avg_request_bytes: float
+        avg_response_bytes: float
+        status_codes: dict[int, int]
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 32 * 1024 * 1024
+PERCENTILES = (50, 90, 99)
+
+# Latency histogram buckets grow by 2% from 1µs, which keeps percentiles within ~1% of the
+# true value and caps each route at ~1200 buckets for latencies up to ~3 hours.
+_HISTOGRAM_MIN = 1e-6
+_HISTOGRAM_LOG_GROWTH = math.log(1.02)
+_HISTOGRAM_MAX_BUCKET = math.ceil(math.log(1e4 / _HISTOGRAM_MIN) / _HISTOGRAM_LOG_GROWTH)
+
+_DYNAMIC_SEGMENT = re.compile(
+    r"(?<=/)(?:\d+"
+    r"|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+    r"|[0-9a-fA-F]{16,})(?=/|$)"
+)
+
+
+def path_template(url: str) -> str:
+    """Collapse numeric, UUID and long hex path segments into ``{id}``."""
+    return _DYNAMIC_SEGMENT.sub("{id}", url.split("?", 1)[0])
+
+
+@dataclass
+class LatencyHistogram:
+    """Fixed-size, log-spaced latency histogram; memory does not grow with the sample count."""
+
+    buckets: Counter[int] = field(default_factory=Counter)
+    count: int = 0
+    minimum: float = math.inf
+    maximum: float = 0.0
+
+    def add(self, value: float) -> None:
+        bucket = 0
+        if value > _HISTOGRAM_MIN:
+            bucket = min(
+                int(math.log(value / _HISTOGRAM_MIN) / _HISTOGRAM_LOG_GROWTH),
+                _HISTOGRAM_MAX_BUCKET,
+            )
+        self.buckets[bucket] += 1
+        self.count += 1
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+
+    def merge(self, other: LatencyHistogram) -> None:
+        self.buckets.update(other.buckets)
+        self.count += other.count
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+    def percentile(self, q: float) -> float | None:
+        """Nearest-rank percentile, reported as the geometric middle of its bucket."""
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(self.count * q / 100))
+        if rank == 1:
+            return self.minimum
+        if rank == self.count:
+            return self.maximum
+        seen = 0
+        for bucket, count in sorted(self.buckets.items()):
+            seen += count
+            if seen >= rank:
+                value = _HISTOGRAM_MIN * math.exp((bucket + 0.5) * _HISTOGRAM_LOG_GROWTH)
+                return min(max(value, self.minimum), self.maximum)
+        return self.maximum
+
+
+@dataclass
+class RouteStats:
+    method: str
+    route: str
+    count: int = 0
+    errors: int = 0
+    request_bytes: int = 0
+    response_bytes: int = 0
+    status_codes: Counter[int] = field(default_factory=Counter)
+    elapsed: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def add(
+        self, status_code: int, request_bytes: int, response_bytes: int, elapsed: float | None
+    ) -> None:
+        self.count += 1
+        self.errors += status_code >= 400  # noqa: PLR2004
+        self.request_bytes += request_bytes
+        self.response_bytes += response_bytes
+        self.status_codes[status_code] += 1
+        if elapsed is not None:
+            self.elapsed.add(elapsed)
+
+    def merge(self, other: RouteStats) -> None:
+        self.count += other.count
+        self.errors += other.errors
+        self.request_bytes += other.request_bytes
+        self.response_bytes += other.response_bytes
+        self.status_codes.update(other.status_codes)
+        self.elapsed.merge(other.elapsed)
+
+    def report(self) -> RouteReport:
+        p50, p90, p99 = (self.elapsed.percentile(q) for q in PERCENTILES)
+        return {
+            "method": self.method,
+            "route": self.route,
+            "count": self.count,
+            "errors": self.errors,
+            "error_rate": self.errors / self.count if self.count else 0.0,
+            "p50_ms": None if p50 is None else p50 * 1000,
+            "p90_ms": None if p90 is None else p90 * 1000,
+            "p99_ms": None if p99 is None else p99 * 1000,
+            "avg_request_bytes": self.request_bytes / self.count if self.count else 0.0,
+            "avg_response_bytes": self.response_bytes / self.count if self.count else 0.0,
+            "status_codes": dict(sorted(self.status_codes.items())),
+        }
+
+
+@dataclass
+class TrafficSummary:
+    routes: dict[tuple[str, str], RouteStats] = field(default_factory=dict)
+    skipped: int = 0
+
+    def add_line(self, line: bytes) -> None:
+        if not line.strip():
+            return
+        try:
+            record = json.loads(line)
+            request = record["request"]
+            response = record["response"]
+            method = request["method"]
+            url = request["url"]
+            if not isinstance(method, str) or not isinstance(url, str):
+                self.skipped += 1
+                return
+            route = path_template(url)
+            status_code = int(response["status_code"])
+            request_bytes = len(request.get("content", "").encode("utf-8"))
+            response_bytes = len(response.get("body", "").encode("utf-8"))
+            elapsed = record.get("elapsed")
+            if elapsed is not None:
+                elapsed = float(elapsed)
+                if not (math.isfinite(elapsed) and elapsed >= 0):
+                    self.skipped += 1
+                    return
+        except (ValueError, KeyError, TypeError, AttributeError):
+            self.skipped += 1
+            return
+        key = (method, route)
+        stats = self.routes.get(key)
+        if stats is None:
+            stats = self.routes[key] = RouteStats(method=method, route=route)
+        stats.add(status_code, request_bytes, response_bytes, elapsed)
+
+    def merge(self, other: TrafficSummary) -> None:
+        self.skipped += other.skipped
+        for key, stats in other.routes.items():
+            if key in self.routes:
+                self.routes[key].merge(stats)
+            else:
+                self.routes[key] = stats
+
+    def report(self) -> list[RouteReport]:
+        return sorted(
+            (stats.report() for stats in self.routes.values()),
+            key=lambda x: (-x["count"], x["route"], x["method"]),
+        )
+
+
+def analyze_range(path: str, start: int, end: int) -> TrafficSummary:
+    """Summarize the JSONL records that *start* within ``[start, end)`` bytes of ``path``."""
+    summary = TrafficSummary()
+    with open(path, "rb") as f:
+        if start:
+            # A line belongs to the range it starts in; skip the tail of the previous one.
+            f.seek(start - 1)
+            f.readline()
+        position = f.tell()
+        for line in f:
+            if position >= end:
+                break
+            position += len(line)
+            summary.add_line(line)
+    return summary
+
+
+def split_ranges(
+    paths: Iterable[str], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> list[tuple[str, int, int]]:
+    if chunk_size <= 0:
+        msg = f"chunk_size must be positive, got {chunk_size}"
+        raise ValueError(msg)
+    ranges: list[tuple[str, int, int]] = []
+    for path in paths:
+        size = os.path.getsize(path)
+        ranges.extend(
+            (path, start, min(start + chunk_size, size)) for start in range(0, size, chunk_size)
+        )
+    return ranges
+
+
+def analyze_files(
+    paths: Iterable[str], jobs: int | None = None, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> TrafficSummary:
+    """Summarize recorded ``ProxyRecorder`` exchanges, parsing file chunks in parallel."""
+    ranges = split_ranges(paths, chunk_size=chunk_size)
+    summary = TrafficSummary()
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    if jobs <= 1 or len(ranges) <= 1:
+        for path, start, end in ranges:
+            summary.merge(analyze_range(path, start, end))
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        from concurrent.futures import as_completed
+
+        with ProcessPoolExecutor(max_workers=min(jobs, len(ranges))) as executor:
+            futures = [executor.submit(analyze_range, *x) for x in ranges]
+            for future in as_completed(futures):
+                summary.merge(future.result())
+    if summary.skipped:
+        logger.warning(
+            "Skipped %d malformed record line(s); indented recordings are not supported",
+            summary.skipped,
+        )
+    return summary
+
+
+def format_report(report: Iterable[RouteReport], skipped: int = 0) -> str:
+    def ms(value: float | None) -> str:
+        return "-" if value is None else f"{value:.1f}"
+
+    header = ("METHOD", "ROUTE", "COUNT", "ERR%", "P50ms", "P90ms", "P99ms", "REQ_B", "RESP_B")
+    rows = [header]
+    rows.extend(
+        (
+            x["method"],
+            x["route"],
+            str(x["count"]),
+            f"{x['error_rate'] * 100:.1f}",
+            ms(x["p50_ms"]),
+            ms(x["p90_ms"]),
+            ms(x["p99_ms"]),
+            f"{x['avg_request_bytes']:.0f}",
+            f"{x['avg_response_bytes']:.0f}",
+        )
+        for x in report
+    )
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+    table = "\n".join(
+        "  ".join(
+            cell.ljust(width) if i < 2 else cell.rjust(width)  # noqa: PLR2004
+            for i, (cell, width) in enumerate(zip(row, widths))
+        ).rstrip()
+        for row in rows
+    )
+    return f"{table}\n\nSkipped lines: {skipped}"
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import json
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler
+from http.server import HTTPServer
+from typing import TYPE_CHECKING
+
+import pytest
+
+from dev_server.proxy_recorder import ProxyRecorder
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+
+class _UnavailableHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        body = "servicio no disponible, 服务不可用".encode()
+        self.send_response(HTTPStatus.SERVICE_UNAVAILABLE)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+
+@pytest.fixture
+def upstream() -> Generator[str, None, None]:
+    server = HTTPServer(("127.0.0.1", 0), _UnavailableHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_records_error_responses(tmp_path: Path, upstream: str) -> None:
+    output = tmp_path / "records.jsonl"
+    recorder = ProxyRecorder(base_url=upstream, output=str(output))
+
+    response = recorder(
+        {
+            "url": "/api/pedidos/7",
+            "method": "GET",
+            "headers": {},
+            "params": {},
+            "content": b"",
+        }
+    )
+    assert response["status_code"] == HTTPStatus.SERVICE_UNAVAILABLE
+    assert b"".join(response["body"]) == "servicio no disponible, 服务不可用".encode()
+
+    (line,) = output.read_text(encoding="utf-8").splitlines()
+    record = json.loads(line)
+    assert record["request"]["url"] == "/api/pedidos/7"
+    assert record["response"]["status_code"] == HTTPStatus.SERVICE_UNAVAILABLE
+    assert record["response"]["body"] == "servicio no disponible, 服务不可用"
+    assert record["elapsed"] >= 0
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from dev_server.__main__ import main
+from dev_server.traffic_analyzer import LatencyHistogram
+from dev_server.traffic_analyzer import analyze_files
+from dev_server.traffic_analyzer import path_template
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _record(method: object, url: object, status_code: int, elapsed: object) -> str:
+    return json.dumps(
+        {
+            "base_url": "https://api.example.com",
+            "request": {
+                "url": url,
+                "method": method,
+                "headers": {},
+                "params": {},
+                "content": "ñandú",
+            },
+            "response": {"status_code": status_code, "headers": {}, "body": "李明"},
+            "elapsed": elapsed,
+        },
+        ensure_ascii=False,
+    )
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("/api/users/42", "/api/users/{id}"),
+        ("/api/users/42/orders/7?expand=true", "/api/users/{id}/orders/{id}"),
+        ("/files/3f2504e0-4f89-11d3-9a0c-0305e82c3301", "/files/{id}"),
+        ("/commits/0123456789abcdef0123", "/commits/{id}"),
+        ("/usuarios/garcía", "/usuarios/garcía"),
+    ],
+)
+def test_path_template(url: str, expected: str) -> None:
+    assert path_template(url) == expected
+
+
+def test_latency_histogram() -> None:
+    histogram = LatencyHistogram()
+    assert histogram.percentile(50) is None
+
+    histogram.add(0.25)
+    assert histogram.percentile(99) == pytest.approx(0.25)
+
+    samples = 1000
+    other = LatencyHistogram()
+    for i in range(1, samples + 1):
+        other.add(i / samples)
+    histogram.merge(other)
+    assert histogram.count == samples + 1
+    assert histogram.percentile(50) == pytest.approx(0.5, rel=0.02)
+    assert histogram.percentile(99) == pytest.approx(0.99, rel=0.02)
+    assert histogram.percentile(100) == pytest.approx(1.0)
+    assert len(histogram.buckets) < samples / 2
+
+    slowest = 1e9
+    histogram.add(0.0)
+    histogram.add(slowest)
+    assert histogram.percentile(0) == 0.0
+    assert histogram.percentile(100) == slowest
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_analyze_files(tmp_path: Path, jobs: int) -> None:
+    ok, failed = 100, 10
+    lines = [_record("GET", f"/api/users/{i}", 200, i / 1000) for i in range(1, ok + 1)]
+    lines += [_record("GET", "/api/users/1", 503, None) for _ in range(failed)]
+    malformed = [
+        "not json",
+        _record("GET", "/api/users/1", 200, {"segundos": 1}),
+        _record("GET", "/", 200, "पांच"),
+        _record("GET", "/api/users/1", 200, "NaN"),
+        _record("GET", "/api/users/1", 200, float("nan")),
+        _record("GET", "/api/users/1", 200, float("inf")),
+        _record("GET", "/api/users/1", 200, -0.25),
+        _record(["GET"], "/api/users/1", 200, 0.1),
+        _record({"verbo": "GET"}, "/api/users/1", 200, 0.1),
+        _record(5, "/api/users/1", 200, 0.1),
+        _record("GET", ["/api/users/1"], 200, 0.1),
+    ]
+    lines += [_record("POST", "/api/users", 201, 0.5), *malformed, ""]
+    path = tmp_path / "records.jsonl"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    # A tiny chunk size forces records to straddle chunk boundaries.
+    summary = analyze_files([str(path)], jobs=jobs, chunk_size=257)
+    assert summary.skipped == len(malformed)
+
+    users, create = summary.report()
+    assert users["method"] == "GET"
+    assert users["route"] == "/api/users/{id}"
+    assert users["count"] == ok + failed
+    assert users["errors"] == failed
+    assert users["error_rate"] == pytest.approx(failed / (ok + failed))
+    assert users["p50_ms"] == pytest.approx(50, rel=0.02)
+    assert users["status_codes"] == {200: ok, 503: failed}
+    assert users["avg_request_bytes"] == len("ñandú".encode())
+    assert users["avg_response_bytes"] == len("李明".encode())
+    assert create["route"] == "/api/users"
+    assert create["count"] == 1
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["--chunk-size", "0"],
+        ["--chunk-size", "-5"],
+        ["--jobs", "0"],
+        ["--jobs", "dos"],
+    ],
+)
+def test_analyze_command_rejects_bad_options(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str], args: list[str]
+) -> None:
+    path = tmp_path / "records.jsonl"
+    path.write_text(_record("GET", "/", 200, 0.1) + "\n", encoding="utf-8")
+    with pytest.raises(SystemExit) as exc_info:
+        main(["analyze", str(path), *args])
+    assert exc_info.value.code != 0
+    assert "positive" in capsys.readouterr().err
+
+
+def test_analyze_command_missing_file(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    path = tmp_path / "faltante.jsonl"
+    with pytest.raises(SystemExit) as exc_info:
+        main(["analyze", str(path)])
+    assert exc_info.value.code != 0
+    assert f"{path}: No such file or directory" in capsys.readouterr().err
+
+
+def test_analyze_command_json(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    path = tmp_path / "records.jsonl"
+    lines = [
+        _record("GET", "/api/productos/9", 200, 0.25),
+        _record("DELETE", "/api/productos/9", 404, 0.5),
+    ]
+    path.write_text("\n".join([*lines, "{"]) + "\n", encoding="utf-8")
+
+    assert main(["analyze", str(path), "--json", "--jobs", "1"]) == 0
+    output = json.loads(capsys.readouterr().out)
+    assert output["skipped"] == 1
+    assert [(x["method"], x["route"], x["errors"]) for x in output["routes"]] == [
+        ("DELETE", "/api/productos/{id}", 1),
+        ("GET", "/api/productos/{id}", 0),
+    ]
+
+
+def test_analyze_command_indented_recording(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    path = tmp_path / "records.json"
+    record = json.loads(_record("GET", "/api/用户/3", 200, 0.1))
+    path.write_text(json.dumps(record, indent=2) + "\n", encoding="utf-8")
+    line_count = len(path.read_text(encoding="utf-8").splitlines())
+
+    assert main(["analyze", str(path), "--json"]) == 1
+    assert json.loads(capsys.readouterr().out) == {"routes": [], "skipped": line_count}
+
+
+def test_analyze_command_table(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    path = tmp_path / "records.jsonl"
+    path.write_text(
+        "\n".join([_record("PUT", "/api/用户/3", 200, 0.02), "no es json"]) + "\n",
+        encoding="utf-8",
+    )
+
+    assert main(["analyze", str(path)]) == 0
+    header, row, blank, footer = capsys.readouterr().out.splitlines()
+    assert header.split()[:3] == ["METHOD", "ROUTE", "COUNT"]
+    assert row.split()[:3] == ["PUT", "/api/用户/{id}", "1"]
+    assert blank == ""
+    assert footer == "Skipped lines: 1"
+
+
+def test_analyze_command_empty_recording(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    path = tmp_path / "records.jsonl"
+    path.write_text("", encoding="utf-8")
+
+    assert main(["analyze", str(path), "--json"]) == 0
+    assert json.loads(capsys.readouterr().out) == {"routes": [], "skipped": 0}